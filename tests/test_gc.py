@@ -0,0 +1,178 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import venv_manager  # noqa: E402
+
+DAY = 86400
+
+
+def make_env(base, name, size, last_run=None, pinned=False):
+    env_path = base / name
+    env_path.mkdir()
+    (env_path / "payload").write_bytes(b"x" * size)
+    usage = {}
+    if last_run is not None:
+        usage["last_run"] = last_run
+    if pinned:
+        usage["pinned"] = True
+    if usage:
+        venv_manager.save_usage(env_path, usage)
+
+
+def test_record_usage(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path)
+    (tmp_path / "env").mkdir()
+    venv_manager.record_usage("env", "last_run")
+    usage = venv_manager.load_usage(tmp_path / "env")
+    assert "last_run" in usage
+    assert venv_manager.last_used(tmp_path / "env") == usage["last_run"]
+
+
+def test_plan_gc_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path)
+    now = 100 * DAY
+    make_env(tmp_path, "old", 1000, last_run=now - 50 * DAY)
+    make_env(tmp_path, "mid", 1000, last_run=now - 20 * DAY)
+    make_env(tmp_path, "new", 1000, last_run=now - 1 * DAY)
+    make_env(tmp_path, "pinned", 1000, last_run=now - 90 * DAY, pinned=True)
+
+    evict = venv_manager.plan_gc(max_age_days=30, now=now)
+    assert [e["name"] for e in evict] == ["old"]
+
+    evict = venv_manager.plan_gc(max_size_bytes=2500, now=now)
+    assert [e["name"] for e in evict] == ["old", "mid"]
+
+    evict = venv_manager.plan_gc(max_size_bytes=0, keep_recent=2, now=now)
+    assert [e["name"] for e in evict] == ["old"]
+
+
+def test_plan_gc_ignores_symlinked_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path / "envs")
+    (tmp_path / "envs").mkdir()
+    interpreter = tmp_path / "python"
+    interpreter.write_bytes(b"x" * 100000)
+    make_env(tmp_path / "envs", "env", 1000, last_run=1)
+    (tmp_path / "envs" / "env" / "python3").symlink_to(interpreter)
+    assert venv_manager.get_dir_size(tmp_path / "envs" / "env") < 2000
+    assert venv_manager.plan_gc(max_size_bytes=2000, now=DAY) == []
+
+
+def test_last_used_survives_pinning(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path)
+    make_env(tmp_path, "env", 10)
+    cfg = tmp_path / "env" / "pyvenv.cfg"
+    cfg.write_text("home = /usr/bin\n")
+    os.utime(cfg, (DAY, DAY))
+    venv_manager.save_usage(tmp_path / "env", {"pinned": False})
+    (tmp_path / "env" / "notes.txt").write_text("notes")
+    assert venv_manager.last_used(tmp_path / "env") == DAY
+    evict = venv_manager.plan_gc(max_age_days=30, now=100 * DAY)
+    assert [e["name"] for e in evict] == ["env"]
+
+
+def answer_inputs(monkeypatch, answers):
+    answers = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+
+def test_gc_envs_packages_before_deleting(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path / "envs")
+    (tmp_path / "envs").mkdir()
+    make_env(tmp_path / "envs", "old", 10, last_run=1)
+    make_env(tmp_path / "envs", "new", 10, last_run=time.time())
+    archive_dir = tmp_path / "archive"
+    packaged = []
+
+    def fake_tarball(env_name, tarball):
+        assert (tmp_path / "envs" / env_name).exists()
+        Path(tarball).write_bytes(b"tar")
+        packaged.append(env_name)
+        return subprocess.CompletedProcess([], 0)
+
+    monkeypatch.setattr(venv_manager, "make_tarball", fake_tarball)
+    answer_inputs(monkeypatch, ["", "30", "", "y", str(archive_dir), ""])
+    venv_manager.gc_envs()
+    assert packaged == ["old"]
+    assert (archive_dir / "old.tar.gz").exists()
+    assert not (tmp_path / "envs" / "old").exists()
+    assert (tmp_path / "envs" / "new").exists()
+
+
+def test_gc_envs_keeps_env_when_packaging_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path / "envs")
+    (tmp_path / "envs").mkdir()
+    make_env(tmp_path / "envs", "old", 10, last_run=1)
+    archive_dir = tmp_path / "archive"
+
+    def failing_tarball(env_name, tarball):
+        Path(tarball).write_bytes(b"partial")
+        return subprocess.CompletedProcess([], 2)
+
+    monkeypatch.setattr(venv_manager, "make_tarball", failing_tarball)
+    answer_inputs(monkeypatch, ["", "30", "", "y", str(archive_dir), ""])
+    venv_manager.gc_envs()
+    assert not (archive_dir / "old.tar.gz").exists()
+    assert (tmp_path / "envs" / "old").exists()
+
+
+def test_gc_envs_rejects_negative_limits(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path)
+    make_env(tmp_path, "env", 10, last_run=time.time())
+    answer_inputs(monkeypatch, ["", "-1", "", ""])
+    venv_manager.gc_envs()
+    assert (tmp_path / "env").exists()
+
+
+def test_gc_envs_rejects_infinite_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path)
+    make_env(tmp_path, "env", 10, last_run=1)
+    answer_inputs(monkeypatch, ["inf", ""])
+    venv_manager.gc_envs()
+    assert (tmp_path / "env").exists()
+
+
+def test_gc_envs_rejects_archive_dir_inside_base_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path)
+    make_env(tmp_path, "old", 10, last_run=1)
+    answer_inputs(monkeypatch, ["", "30", "", "y", str(tmp_path / "archive"), ""])
+    venv_manager.gc_envs()
+    assert not (tmp_path / "archive").exists()
+    assert (tmp_path / "old").exists()
+
+
+def test_gc_envs_does_not_overwrite_existing_tarball(tmp_path, monkeypatch):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path / "envs")
+    (tmp_path / "envs").mkdir()
+    make_env(tmp_path / "envs", "old", 10, last_run=1)
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    (archive_dir / "old.tar.gz").write_bytes(b"earlier")
+    monkeypatch.setattr(venv_manager, "make_tarball", lambda env_name, tarball: pytest.fail("overwrote tarball"))
+    answer_inputs(monkeypatch, ["", "30", "", "y", str(archive_dir), ""])
+    venv_manager.gc_envs()
+    assert (archive_dir / "old.tar.gz").read_bytes() == b"earlier"
+    assert (tmp_path / "envs" / "old").exists()
+
+
+def test_gc_envs_reports_missing_tar_as_packaging_error(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(venv_manager, "BASE_DIR", tmp_path / "envs")
+    (tmp_path / "envs").mkdir()
+    make_env(tmp_path / "envs", "old", 10, last_run=1)
+
+    def missing_tar(env_name, tarball):
+        raise FileNotFoundError("tar")
+
+    monkeypatch.setattr(venv_manager, "make_tarball", missing_tar)
+    answer_inputs(monkeypatch, ["", "30", "", "y", str(tmp_path / "archive"), ""])
+    venv_manager.gc_envs()
+    out = capsys.readouterr().out
+    assert "Error packaging 'old', skipped" in out
+    assert "Error removing" not in out
+    assert (tmp_path / "envs" / "old").exists()
@@ -2,6 +2,8 @@
 import os
 import sys
 import venv
+import json
+import time
 import shutil
 import subprocess
 from pathlib import Path
@@ -9,6 +11,7 @@ from datetime import datetime
 
 BASE_DIR = Path.home() / "python_envs"
 BORDER = "─" * 40
+USAGE_FILE = "usage.json"
 
 def clear_screen():
     os.system('clear')
@@ -40,6 +43,98 @@ def get_available_envs():
         return []
     return [d.name for d in BASE_DIR.iterdir() if d.is_dir()]
 
+def get_dir_size(path):
+    total = 0
+    for p in path.rglob('*'):
+        if p.is_file() and not p.is_symlink():
+            try:
+                total += p.lstat().st_size
+            except Exception:
+                pass
+    return total
+
+def format_timestamp(ts):
+    if not ts:
+        return "Never"
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+
+def load_usage(env_path):
+    usage_file = env_path / USAGE_FILE
+    try:
+        with usage_file.open("r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_usage(env_path, usage):
+    usage_file = env_path / USAGE_FILE
+    tmp_file = env_path / (USAGE_FILE + ".tmp")
+    with tmp_file.open("w") as f:
+        json.dump(usage, f)
+    tmp_file.replace(usage_file)
+
+def record_usage(env_name, key):
+    env_path = BASE_DIR / env_name
+    usage = load_usage(env_path)
+    usage[key] = time.time()
+    try:
+        save_usage(env_path, usage)
+    except OSError:
+        pass
+
+def last_used(env_path):
+    usage = load_usage(env_path)
+    stamps = [usage.get("last_activated"), usage.get("last_run")]
+    stamps = [ts for ts in stamps if isinstance(ts, (int, float))]
+    if stamps:
+        return max(stamps)
+    try:
+        return (env_path / "pyvenv.cfg").stat().st_mtime
+    except OSError:
+        pass
+    try:
+        return os.path.getctime(env_path)
+    except OSError:
+        return 0
+
+def plan_gc(max_size_bytes=None, max_age_days=None, keep_recent=0, now=None):
+    if now is None:
+        now = time.time()
+    entries = []
+    for env_name in get_available_envs():
+        env_path = BASE_DIR / env_name
+        entries.append({
+            "name": env_name,
+            "size": get_dir_size(env_path),
+            "last_used": last_used(env_path),
+            "pinned": bool(load_usage(env_path).get("pinned")),
+        })
+    entries.sort(key=lambda e: e["last_used"])
+    candidates = [e for e in entries if not e["pinned"]]
+    if keep_recent > 0:
+        candidates = candidates[:-keep_recent]
+    evict = []
+    if max_age_days is not None:
+        cutoff = now - max_age_days * 86400
+        for entry in candidates:
+            if entry["last_used"] < cutoff:
+                evict.append(dict(entry, reason=f"unused for more than {max_age_days} days"))
+    if max_size_bytes is not None:
+        total = sum(e["size"] for e in entries) - sum(e["size"] for e in evict)
+        evicted = {e["name"] for e in evict}
+        for entry in candidates:
+            if total <= max_size_bytes:
+                break
+            if entry["name"] in evicted:
+                continue
+            evict.append(dict(entry, reason="total size over limit"))
+            total -= entry["size"]
+    return evict
+
+def make_tarball(env_name, tarball):
+    return subprocess.run(["tar", "-czf", tarball, "-C", str(BASE_DIR), env_name])
+
 def select_environment(prompt):
     envs = get_available_envs()
     if not envs:
@@ -188,6 +283,7 @@ def activate_env():
         print("\nError: Activation script not found.")
         pause()
         return
+    record_usage(env_name, "last_activated")
     print("\nActivation Instructions")
     print(BORDER)
     print(f"Run this command to activate:\n\n  source {activate_script}\n")
@@ -207,6 +303,7 @@ def run_command_in_env():
     env_path = BASE_DIR / env_name
     new_env = os.environ.copy()
     new_env['PATH'] = f"{env_path / 'bin'}:" + new_env.get('PATH', '')
+    record_usage(env_name, "last_run")
     try:
         subprocess.run(command, shell=True, env=new_env)
     except Exception as e:
@@ -220,6 +317,7 @@ def interactive_shell():
     env_path = BASE_DIR / env_name
     new_env = os.environ.copy()
     new_env['PATH'] = f"{env_path / 'bin'}:" + new_env.get('PATH', '')
+    record_usage(env_name, "last_activated")
     print(f"\nStarting interactive shell for '{env_name}'. Type 'exit' to return.")
     subprocess.run("/bin/bash", env=new_env, shell=True)
     pause()
@@ -234,15 +332,7 @@ def environment_details():
         creation_date = datetime.fromtimestamp(ctime).strftime('%Y-%m-%d %H:%M:%S')
     except Exception:
         creation_date = "Unknown"
-    def get_dir_size(path):
-        total = 0
-        for p in path.rglob('*'):
-            if p.is_file():
-                try:
-                    total += p.stat().st_size
-                except Exception:
-                    pass
-        return total
+    usage = load_usage(env_path)
     size_bytes = get_dir_size(env_path)
     pip_path = env_path / "bin" / "pip"
     num_packages = 0
@@ -258,6 +348,9 @@ def environment_details():
     print(f"Creation date   : {creation_date}")
     print(f"Size on disk   : {size_bytes} bytes")
     print(f"Installed pkgs : {num_packages}")
+    print(f"Last activated : {format_timestamp(usage.get('last_activated'))}")
+    print(f"Last run       : {format_timestamp(usage.get('last_run'))}")
+    print(f"Pinned         : {'yes' if usage.get('pinned') else 'no'}")
     print(BORDER)
     pause()
 
@@ -439,12 +532,103 @@ def package_env():
     if not tarball:
         tarball = default_tar
     try:
-        subprocess.run(["tar", "-czf", tarball, "-C", str(BASE_DIR), env_name])
+        make_tarball(env_name, tarball)
         print(f"Environment '{env_name}' packaged into {tarball}.")
     except Exception as e:
         print(f"Error: {e}")
     pause()
 
+def pin_env():
+    env_name = select_environment("Choose environment to pin/unpin")
+    if not env_name:
+        return
+    env_path = BASE_DIR / env_name
+    usage = load_usage(env_path)
+    usage["pinned"] = not usage.get("pinned")
+    try:
+        save_usage(env_path, usage)
+        state = "pinned" if usage["pinned"] else "unpinned"
+        print(f"Environment '{env_name}' {state}.")
+    except Exception as e:
+        print(f"Error: {e}")
+    pause()
+
+def gc_envs():
+    print("\nGarbage Collect Environments")
+    print(BORDER)
+    try:
+        max_size = input("Max total size in MB (blank for no limit): ").strip()
+        max_size_bytes = int(float(max_size) * 1024 * 1024) if max_size else None
+        max_age = input("Max days since last use (blank for no limit): ").strip()
+        max_age_days = int(max_age) if max_age else None
+        keep = input("Always keep N most recently used (default: 0): ").strip()
+        keep_recent = int(keep) if keep else 0
+    except (ValueError, OverflowError):
+        print("Error: Invalid number provided.")
+        pause()
+        return
+    if any(v is not None and v < 0 for v in (max_size_bytes, max_age_days, keep_recent)):
+        print("Error: Limits must not be negative.")
+        pause()
+        return
+    if max_size_bytes is None and max_age_days is None:
+        print("No limits given, nothing to collect.")
+        pause()
+        return
+    evict = plan_gc(max_size_bytes, max_age_days, keep_recent)
+    if not evict:
+        print("\nNothing to reclaim.")
+        pause()
+        return
+    print("\nEnvironments to reclaim (least recently used first):")
+    print(BORDER)
+    for entry in evict:
+        print(f"  {entry['name']}: {entry['size']} bytes, last used {format_timestamp(entry['last_used'])}"
+              f" ({entry['reason']})")
+    print(BORDER)
+    print(f"Total reclaimable: {sum(e['size'] for e in evict)} bytes")
+    choice = input("Delete these environments? (y/N, anything else is a dry run): ").strip().lower()
+    if choice != 'y':
+        print("Dry run only, nothing deleted.")
+        pause()
+        return
+    archive_dir = input("Package into directory before deleting (blank to skip): ").strip()
+    if archive_dir:
+        if Path(archive_dir).resolve().is_relative_to(BASE_DIR.resolve()):
+            print(f"Error: Archive directory must be outside {BASE_DIR}.")
+            pause()
+            return
+        try:
+            Path(archive_dir).mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"Error: {e}")
+            pause()
+            return
+    for entry in evict:
+        env_name = entry["name"]
+        try:
+            if archive_dir:
+                tarball = str(Path(archive_dir) / f"{env_name}.tar.gz")
+                if Path(tarball).exists():
+                    print(f"Error: {tarball} already exists, '{env_name}' skipped.")
+                    continue
+                try:
+                    returncode = make_tarball(env_name, tarball).returncode
+                except Exception as e:
+                    Path(tarball).unlink(missing_ok=True)
+                    print(f"Error packaging '{env_name}', skipped: {e}")
+                    continue
+                if returncode != 0:
+                    Path(tarball).unlink(missing_ok=True)
+                    print(f"Error packaging '{env_name}', skipped.")
+                    continue
+                print(f"Environment '{env_name}' packaged into {tarball}.")
+            shutil.rmtree(BASE_DIR / env_name)
+            print(f"Environment '{env_name}' deleted.")
+        except Exception as e:
+            print(f"Error removing '{env_name}': {e}")
+    pause()
+
 def search_envs():
     search_str = input("Enter search string: ").strip().lower()
     if not search_str:
@@ -505,7 +689,9 @@ def env_management_menu():
         print("3. Delete environment")
         print("4. Rename environment")
         print("5. Clone environment")
-        print("6. Back")
+        print("6. Pin/unpin environment")
+        print("7. Garbage collect environments")
+        print("8. Back")
         print(BORDER)
         choice = input("Enter your choice: ").strip()
         if choice == "1":
@@ -519,6 +705,10 @@ def env_management_menu():
         elif choice == "5":
             clone_env()
         elif choice == "6":
+            pin_env()
+        elif choice == "7":
+            gc_envs()
+        elif choice == "8":
             break
         else:
             print("Invalid choice.")